@@ -1,64 +1,88 @@
 """Creative celebration planner showcasing parallel agent execution."""
 
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.agents.llm_agent import Agent
-from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.apps.app import App
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.function_tool import FunctionTool
+from celebration_planner.tools import draft_key
+from celebration_planner.tools import get_artifact
+from celebration_planner.tools import publish_artifact
+
+# Shared leading block so the cluster prompts start with an identical prefix.
+_INDIAN_CONTEXT = (
+    "Audience: Indian hosts and guests. Quote costs in INR, favour Indian flavours, aesthetics, and "
+    "traditions, and respect the host location (in-city vs destination).\n"
+)
+_REPLY_TO_CLUSTER = "Reply with the JSON only; `creative_brainstorm_cluster` collects it."
+# ``execution_mode`` is set in session state by ``personal_assistant.offline``.
+_OFFLINE_MODE_NOTE = (
+    "Execution mode: {execution_mode?}. If offline, never ask follow-ups; state assumptions and proceed."
+)
 
 theme_designer_agent = Agent(
     model="gemini-2.5-flash",
     name="theme_designer_agent",
     description="Dreams up cohesive celebration themes and ambience ideas.",
-    instruction=(
-        "You are a rapid ideation designer for Indian celebrations.\n"
-        "- Produce 2-3 themed concepts tailored to the event brief you receive and the guest location (in-"
-        "city vs destination).\n"
-        "- For each concept, include `Theme Name`, `Mood Palette`, `Headline Visuals`, "
-        "`Decor Touches`, and a one-line `Why it fits` justification referencing Indian aesthetics"
-        " (festive colours, regional crafts, Bollywood cues, etc.).\n"
-        "- Return your findings as JSON with the schema: "
-        "`{'concepts': [{...}]}` to keep output machine-readable.\n"
-        "- Do not repeat guidance from other agents; focus purely on ambience and theming.\n"
-        "- Once complete, immediately call `transfer_to_agent` to return control to `creative_brainstorm_cluster`."
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: rapid ideation designer. Produce 2-3 themed concepts for the brief; ambience and theming only.\n"
+        "JSON: {concepts:[{name,mood_palette,headline_visuals,decor_touches,why_it_fits}]} "
+        "(why_it_fits: one line citing Indian aesthetics, e.g. festive colours, regional crafts, Bollywood cues)."
     ),
+    instruction=_REPLY_TO_CLUSTER,
+    output_key=draft_key("theme"),
+    after_agent_callback=publish_artifact,
 )
 
 menu_mixologist_agent = Agent(
     model="gemini-2.5-flash-lite",
     name="menu_mixologist_agent",
     description="Pairs food and beverage menus with dietary callouts.",
-    instruction=(
-        "Design 2 complementary menu boards aligned with the event goals, spotlighting Indian flavours and any "
-        "regional requests.\n"
-        "- Each menu should list `Signature Dish`, `Side or Snack`, `Drink Pairing`, and "
-        "`Dietary Notes` (vegan, gluten-free, Jain, etc.).\n"
-        "- Keep servings practical for a home or small venue gathering, and include estimated cost per guest in INR.\n"
-        "- Return machine-readable JSON: `{'menus': [{...}]}`.\n"
-        "- Avoid duplication of theme language; concentrate on taste, plating, and prep ease.\n"
-        "- Once complete, immediately call `transfer_to_agent` to return control to `creative_brainstorm_cluster`."
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: menu designer. Produce 2 complementary menu boards for the brief, practical for a home or small "
+        "venue; focus on taste, plating, and prep ease, not theme language.\n"
+        "JSON: {menus:[{signature_dish,side_or_snack,drink_pairing,dietary_notes,cost_per_guest_inr}]} "
+        "(dietary_notes: vegan, gluten-free, Jain, etc.)."
     ),
+    instruction=_REPLY_TO_CLUSTER,
+    output_key=draft_key("menu"),
+    after_agent_callback=publish_artifact,
 )
 
 activity_architect_agent = Agent(
     model="gemini-2.5-flash",
     name="activity_architect_agent",
     description="Designs interactive games, rituals, and keepsakes.",
-    instruction=(
-        "Curate 2-3 activity arcs that match the brief and resonate with Indian guests.\n"
-        "- Each arc should outline `Activity Name`, `Runtime`, `Energy Level`, "
-        "`Required Props`, and a short facilitation tip.\n"
-        "- Ensure at least one quieter option and one high-energy option, highlighting culturally relevant touchpoints "
-        "(e.g., sangeet-style performances, mehendi corners, DIY rangoli, contemporary board games).\n"
-        "- Share output as JSON: `{'activities': [{...}]}` to align with the other agents.\n"
-        "- Once complete, immediately call `transfer_to_agent` to return control to `creative_brainstorm_cluster`."
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: activity curator. Produce 2-3 activity arcs for the brief, at least one quiet and one high-energy, "
+        "with cultural touchpoints (sangeet-style performances, mehendi corners, DIY rangoli, board games).\n"
+        "JSON: {activities:[{name,runtime,energy_level,required_props,facilitation_tip}]}."
     ),
+    instruction=_REPLY_TO_CLUSTER,
+    output_key=draft_key("activities"),
+    after_agent_callback=publish_artifact,
 )
 
-creative_brainstorm_cluster = ParallelAgent(
+creative_brainstorm_cluster = Agent(
+    model="gemini-2.5-flash-lite",
     name="creative_brainstorm_cluster",
     description="Runs theme, menu, and activity micro-agents in parallel for faster ideation.",
-    sub_agents=[
-        theme_designer_agent,
-        menu_mixologist_agent,
-        activity_architect_agent,
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: fan-out coordinator. In ONE turn call `theme_designer_agent`, `menu_mixologist_agent`, and "
+        "`activity_architect_agent` together with the full brief; never sequentially, add no ideas."
+    ),
+    instruction=(
+        "Each agent answers with an artifact ID. Return only those IDs as {theme,menu,activities} and call "
+        "`transfer_to_agent` to return control to `celebration_orchestrator`."
+    ),
+    tools=[
+        AgentTool(theme_designer_agent),
+        AgentTool(menu_mixologist_agent),
+        AgentTool(activity_architect_agent),
     ],
 )
 
@@ -66,47 +90,58 @@ experience_synthesizer_agent = Agent(
     model="gemini-2.5-flash",
     name="experience_synthesizer_agent",
     description="Fuses parallel brainstorm outputs into polished celebration kits.",
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: merge the theme, menu, and activity JSON into the two strongest end-to-end concepts and write the "
+        "final celebration game plan directly to the host. Fetch each payload with `get_artifact` by artifact ID, "
+        "once per ID.\n"
+        "Markdown per concept: `Concept`, `Why it Wins`, `Prep Timeline` (Indian vendor lead times, public "
+        "holidays), `Shopping List` (Indian vendors or DIY), `Experience Flow`; plus a budget snapshot "
+        "(decor, food/drink, extras; conversion if abroad), cost-saving hacks, accessibility/dietary/cultural "
+        "accommodations (e.g. vegetarian service order, auspicious timing), and optional add-ons (photo moments, "
+        "favors, playlists). Resolve conflicts such as dietary limits vs menu.\n"
+        "Close with next actions and a motivational sign-off."
+    ),
     instruction=(
-        "You harmonize inputs from the theme, menu, and activity agents for an Indian audience.\n"
-        "- Merge their JSON payloads to craft the two strongest end-to-end celebration concepts.\n"
-        "- For each concept, summarize theme, menu, and activity beats, plus a quick setup schedule and "
-        "supplies checklist that references Indian vendors or DIY options when possible.\n"
-        "- Flag any conflicts (e.g., dietary limitations vs. menu ideas) and resolve them with adjustments.\n"
-        "- Return findings as markdown with clear sections (`Concept`, `Why it Wins`, `Prep Timeline`, "
-        "`Shopping List`, `Experience Flow`), quoting budgets in INR and flagging cost-saving hacks.\n"
-        "- Do not deliver the final user-facing message; hand control back promptly by calling "
-        "`transfer_to_agent` to return control to `celebration_orchestrator`."
+        "Artifacts: theme={theme_artifact?}, menu={menu_artifact?}, activities={activities_artifact?}.\n"
+        "Start as soon as you have the payloads; this answer streams to the host as the final message, so do "
+        "not transfer control back."
     ),
+    tools=[FunctionTool(get_artifact)],
 )
 
 root_agent = Agent(
     model="gemini-2.5-flash",
     name="celebration_orchestrator",
     description="Coordinates a creative sprint to plan unforgettable celebrations.",
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: celebration planning orchestrator.\n"
+        "1. Confirm essentials once: host city/state, local vs destination (offer both if unsure), occasion, "
+        "audience, headcount, venue constraints, INR budget, vibe, hard restrictions (dietary, noise, rites).\n"
+        "2. Summarize the brief and call `transfer_to_agent('creative_brainstorm_cluster')` with it.\n"
+        "3. When the cluster returns its artifact IDs, immediately call "
+        "`transfer_to_agent('experience_synthesizer_agent')` without restating the brainstorm; it fetches the "
+        "artifacts and streams the final game plan to the host."
+    ),
     instruction=(
-        "You are the celebration planning orchestrator for Indian hosts.\n"
-        "Workflow:\n"
-        "1. Collect or confirm essentials: host city/state in India, whether the celebration should stay local or move "
-        "to another destination, occasion, audience, headcount, location constraints, budget guardrails in INR, "
-        "vibe preferences, and any hard restrictions (dietary, noise limits, cultural rites). Ask follow-ups once if "
-        "needed and volunteer local vs destination options when the user is unsure.\n"
-        "2. Summarize the brief and call `transfer_to_agent('creative_brainstorm_cluster')`. Provide the distilled "
-        "context so the three micro-agents can work in parallel with the host location choice.\n"
-        "3. After the parallel cluster completes, immediately call `transfer_to_agent('experience_synthesizer_agent')` "
-        "with the compiled results and user goals.\n"
-        "4. On return, craft a final celebration game plan with:\n"
-        "   • Top 2 themed experience kits (theme + menu + activities).\n"
-        "   • Setup timeline and key prep milestones tuned to Indian vendor lead times and public holidays.\n"
-        "   • Budget snapshot (estimates for decor, food/drink, extras) in INR with optional conversion if venue is "
-        "abroad.\n"
-        "   • Accessibility, dietary, and cultural accommodations (e.g., vegetarian service sequences, auspicious timing).\n"
-        "   • Optional add-ons (photo moments, take-home favors, playlists) rooted in Indian pop culture or traditions.\n"
-        "5. Close with next actions and a motivational sign-off that resonates with Indian hosts.\n"
-        "Stay concise, energetic, and ensure parallel outputs are woven together seamlessly. Do not output a final "
-        "message until `experience_synthesizer_agent` has finished and returned control."
+        "Stay concise and energetic. Never write, repeat, or summarize the game plan yourself.\n"
+        f"{_OFFLINE_MODE_NOTE}"
     ),
     sub_agents=[
         creative_brainstorm_cluster,
         experience_synthesizer_agent,
     ],
 )
+
+# Each agent's ``static_instruction`` (shared context, role, schema) is the
+# literal prefix of every request, so Gemini can serve it from an explicit
+# context cache; the short ``instruction`` footer is sent after it as content.
+app = App(
+    name="celebration_planner",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        min_tokens=1024,
+        ttl_seconds=30 * 60,
+    ),
+)
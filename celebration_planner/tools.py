@@ -0,0 +1,115 @@
+"""Artifact store shared by the celebration planner agents.
+
+Brainstorm agents publish their JSON into session state as versioned
+artifacts and hand back only the artifact ID, so the payloads are never
+re-broadcast through the coordinator or orchestrator prompts. The
+synthesizer reads them on demand with ``get_artifact``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import TypedDict
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+_LOGGER = logging.getLogger(__name__)
+
+# Brainstorm agent name -> artifact kind.
+ARTIFACT_KINDS: Dict[str, str] = {
+    "theme_designer_agent": "theme",
+    "menu_mixologist_agent": "menu",
+    "activity_architect_agent": "activities",
+}
+
+# Readers may lag the latest published version by at most this many steps.
+_MAX_STALENESS = 1
+
+_PAYLOAD_PREFIX = "artifact:"
+
+
+class Artifact(TypedDict):
+  artifact_id: str
+  payload: Any
+
+
+def draft_key(kind: str) -> str:
+  """State key the brainstorm agent writes its raw output to."""
+  return f"{kind}_draft"
+
+
+def latest_key(kind: str) -> str:
+  """State key holding the latest artifact ID for ``kind``."""
+  return f"{kind}_artifact"
+
+
+def _parse_artifact_id(artifact_id: str) -> Tuple[str, int]:
+  kind, sep, version = artifact_id.rpartition("_v")
+  if not sep or kind not in ARTIFACT_KINDS.values() or not version.isdigit():
+    raise ValueError(f"Malformed artifact id '{artifact_id}'.")
+  return kind, int(version)
+
+
+def publish_artifact(callback_context: CallbackContext) -> types.Content:
+  """Store the agent's draft as the next artifact version and return its ID.
+
+  Used as ``after_agent_callback``; the returned content replaces the JSON
+  payload as the agent's final answer.
+  """
+  kind = ARTIFACT_KINDS[callback_context.agent_name]
+  state = callback_context.state
+  previous = state.get(latest_key(kind))
+  version = _parse_artifact_id(previous)[1] + 1 if previous else 1
+  artifact_id = f"{kind}_v{version}"
+
+  state[f"{_PAYLOAD_PREFIX}{artifact_id}"] = state.get(draft_key(kind))
+  # Clear the draft so the payload is only persisted once, as the artifact.
+  state[draft_key(kind)] = None
+  state[latest_key(kind)] = artifact_id
+  _LOGGER.debug("Published artifact %s", artifact_id)
+  return types.Content(
+      role="model", parts=[types.Part(text=f'{{"artifact_id": "{artifact_id}"}}')]
+  )
+
+
+def get_artifact(artifact_id: str, tool_context: ToolContext) -> Artifact:
+  """Fetch a brainstorm artifact published earlier in this session.
+
+  Args:
+    artifact_id: ID returned by a brainstorm agent, e.g. ``theme_v1``.
+
+  Returns:
+    The artifact ID and its JSON payload.
+  """
+  artifact_id = artifact_id.strip()
+  kind, version = _parse_artifact_id(artifact_id)
+  state = tool_context.state
+  latest = state.get(latest_key(kind))
+  if not latest:
+    raise ValueError(f"No '{kind}' artifact has been published yet.")
+
+  latest_version = _parse_artifact_id(latest)[1]
+  if latest_version - version > _MAX_STALENESS:
+    raise ValueError(
+        f"Artifact '{artifact_id}' is stale; the latest is '{latest}'."
+    )
+
+  payload = state.get(f"{_PAYLOAD_PREFIX}{artifact_id}")
+  if payload is None:
+    raise ValueError(f"Unknown artifact '{artifact_id}'.")
+  return Artifact(artifact_id=artifact_id, payload=payload)
+
+
+__all__ = [
+    "ARTIFACT_KINDS",
+    "Artifact",
+    "draft_key",
+    "get_artifact",
+    "latest_key",
+    "publish_artifact",
+]
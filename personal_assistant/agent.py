@@ -1,105 +1,112 @@
 """Multi-agent travel orchestration using Google ADK."""
 
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.agents.llm_agent import Agent
+from google.adk.apps.app import App
 from google.adk.tools.function_tool import FunctionTool
 from personal_assistant.tools import fetch_safety_brief
+from personal_assistant.tools import fetch_safety_briefs
 from personal_assistant.tools import fetch_weather_summary
 
+# Shared leading block so the specialist prompts start with an identical prefix.
+_INDIAN_CONTEXT = (
+    "Audience: Indian travellers. Quote costs in INR, compare with typical Indian climates and norms, and "
+    "consider logistics, payment modes, and documentation from India.\n"
+)
+# ``execution_mode`` is set in session state by ``personal_assistant.offline``.
+_OFFLINE_MODE_NOTE = (
+    "Execution mode: {execution_mode?}. If offline, never ask follow-ups; state assumptions and proceed."
+)
+_TRANSFER_BACK = (
+    "When done, call `transfer_to_agent` to return control to `travel_orchestrator`; "
+    "no final user-facing answer."
+)
+
 weather_intel_tool = FunctionTool(fetch_weather_summary)
 safety_intel_tool = FunctionTool(fetch_safety_brief)
+multi_city_safety_tool = FunctionTool(fetch_safety_briefs)
 
-weather_data_agent = Agent(
+intel_cluster = Agent(
     model='gemini-2.5-flash-lite',
-    name='weather_data_agent',
-    description='Retrieves structured weather data for downstream reasoning.',
+    name='intel_cluster',
+    description='Fetches weather data and local news headlines in parallel.',
+    static_instruction=(
+        "Role: fan-out fetcher. In ONE turn call `fetch_weather_summary` (destination, coverage window) and "
+        "`fetch_safety_brief` (destination, default parameters) together; never sequentially, no interpretation.\n"
+        "Multi-city trips: call `fetch_weather_summary` once per city and a single `fetch_safety_briefs` with all "
+        "cities instead of `fetch_safety_brief`, all in the same turn."
+    ),
     instruction=(
-        "Call `fetch_weather_summary` immediately using the trip destination and desired coverage window.\n"
-        "- Return a compact JSON block capturing current conditions, 5-day outlook, UV, wind, and any notable "
-        "alerts.\n"
-        "- Do not interpret or summarize; provide raw but tidy data for the next agent.\n"
-        "- When finished, call `transfer_to_agent` to hand control back to `travel_orchestrator`."
+        "Then return the tool results as compact JSON {weather,news} and call `transfer_to_agent` to return "
+        "control to `travel_orchestrator`."
     ),
-    tools=[weather_intel_tool],
+    tools=[
+        weather_intel_tool,
+        safety_intel_tool,
+        multi_city_safety_tool,
+    ],
 )
 
 weather_agent = Agent(
     model='gemini-2.5-flash',
     name='weather_intel_agent',
     description='Weather intelligence analyst for trip planning.',
-    instruction=(
-        "You are responsible for gathering weather intelligence for trip plans with an Indian traveller in mind.\n"
-        "- Use the structured weather data provided by `weather_data_agent` along with user context.\n"
-        "- Focus on the travel dates or trip length provided.\n"
-        "- Translate raw data into actionable guidance: packing tips, risky weather windows, "
-        "and timing suggestions, noting how conditions compare to typical Indian climates so the traveller "
-        "can adapt clothing or gear.\n"
-        "- Raise flags for severe weather, storms, heat waves, or precipitation spikes.\n"
-        "- Return concise bullet points grouped by `Current`, `Daily Outlook`, and `Implications`.\n"
-        "- Once your analysis is complete, call `transfer_to_agent` to hand control back to "
-        "`travel_orchestrator` without issuing a final user-facing answer."
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: weather analyst. Turn the `intel_cluster` weather data for the travel window into packing tips, "
+        "risky windows, and timing advice; flag storms, heat waves, or precipitation spikes.\n"
+        "Data: `daily_forecast` columns dates,max_temp_c,min_temp_c,precip_probability,precipitation_total_mm,"
+        "uv_index_max,wind_speed_max_kmh,sunrise,sunset and optional `hourly_outlook` columns times,temperature_c,"
+        "precip_probability,relative_humidity,weather_code; same index = same day/hour.\n"
+        "Output: concise bullets under `Current`, `Daily Outlook`, `Implications`."
     ),
+    instruction=_TRANSFER_BACK,
 )
 
-safety_agent = Agent(
+local_news_agent = Agent(
     model='gemini-2.5-flash',
-    name='safety_watch_agent',
-    description='Monitors safety advisories, disruptions, and major events.',
-    instruction=(
-        "You focus on official advisories and high-impact alerts.\n"
-        "- Build on the latest local incident feed and any prior context to surface credible advisories, "
-        "entry requirements, health notices, or geopolitical risks.\n"
-        "- Highlight severity, credibility of information, and required actions for travelers.\n"
-        "- Coordinate with findings from local news analysts to present a consistent risk picture.\n"
-        "- After delivering your findings, immediately call `transfer_to_agent` to return control to "
-        "`travel_orchestrator`."
-    ),
-)
-
-local_news_fetch_agent = Agent(
-    model='gemini-2.5-flash-lite',
-    name='local_news_fetch_agent',
-    description='Fetches recent news headlines for the destination.',
-    instruction=(
-        "Immediately call `fetch_safety_brief` with the destination (and default parameters).\n"
-        "- Return a concise JSON payload listing the most relevant headlines (title, link, snippet, date).\n"
-        "- Do not add interpretation; the next agent will assess risk levels.\n"
-        "- After returning the data, call `transfer_to_agent` to hand control back to `travel_orchestrator`."
+    name='local_news_safety_agent',
+    description='Scans local news to assess on-the-ground safety conditions.',
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: local safety analyst. Use the `intel_cluster` news headlines and context.\n"
+        "Output: verdict `Safe`|`Caution`|`Avoid` with a short evidence-based justification, then concrete "
+        "incidents, dates, and recommended traveller actions."
     ),
-    tools=[safety_intel_tool],
+    instruction=_TRANSFER_BACK,
 )
 
-local_news_agent = Agent(
+safety_agent = Agent(
     model='gemini-2.5-flash',
-    name='local_news_safety_agent',
-    description='Scans local news to assess on-the-ground safety conditions.',
-    instruction=(
-        "You determine local situational safety using fresh news coverage.\n"
-        "- Analyze the structured feed provided by `local_news_fetch_agent` and any additional context.\n"
-        "- Classify the destination as `Safe`, `Caution`, or `Avoid` with a short justification "
-        "based on news evidence.\n"
-        "- Provide a concise briefing with concrete incidents, dates, and recommended traveler actions.\n"
-        "- When you finish, call `transfer_to_agent` to give control back to `travel_orchestrator`."
+    name='safety_watch_agent',
+    description='Monitors safety advisories, disruptions, and major events.',
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: official advisory analyst. Building on the local incident findings, surface credible advisories, "
+        "entry requirements, health notices, and geopolitical risks consistent with the local news verdict.\n"
+        "Output: each item with severity, source credibility, and required traveller action."
     ),
+    instruction=_TRANSFER_BACK,
 )
 
 trip_planner_agent = Agent(
     model='gemini-2.5-flash',
     name='trip_planner_agent',
     description='Designs itineraries before, during, and after the trip.',
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: trip planner. Using the gathered weather and safety findings, write the final plan directly to "
+        "the traveller.\n"
+        "Open with a summary of: weather for the travel window; safety verdict (Safe/Caution/Avoid) with "
+        "justification; packing; main route from the origin; must-visit attractions; INR budget (secondary "
+        "currency only if relevant); legal needs (visas, permits, local laws, Indian documents for outbound trips).\n"
+        "Then sections `Before Departure`, `During Trip`, `After Return`, tailored to trip length and preferences: "
+        "weather/safety-aware scheduling, logistics (transport, lodging, reservations, Indian carriers and payment "
+        "options), enrichment ideas, and contingency plans."
+    ),
     instruction=(
-        "Craft the end-to-end travel plan using previously gathered weather and safety findings.\n"
-        "- Structure the output with sections: `Before Departure`, `During Trip`, `After Return`.\n"
-        "- Tailor recommendations to the trip length (weekend, short, long) and user preferences.\n"
-        "- Integrate weather alerts and safety advisories into scheduling and packing guidance.\n"
-        "- Suggest logistics (transport, lodging checks, reservations) and enrichment ideas with an Indian "
-        "traveller lens: reference INR price bands, popular Indian payment options, and domestic carriers "
-        "or visa needs when heading abroad.\n"
-        "- Highlight contingency plans or alternative activities when needed.\n"
-        "- Prepare concise notes for: packing checklist, travel routes from the origin, must-see landmarks, "
-        "baseline budget ranges (in INR with rough conversions if overseas), and legal or documentation "
-        "requirements.\n"
-        "- After you have drafted the trip blueprint, call `transfer_to_agent` to return control to "
-        "`travel_orchestrator` for the final synthesis."
+        "Start as soon as you have the findings; this answer streams to the traveller as the final message, so do "
+        "not transfer control back."
     ),
 )
 
@@ -107,43 +114,36 @@ root_agent = Agent(
     model='gemini-2.5-flash',
     name='travel_orchestrator',
     description='Coordinates specialized agents to deliver full travel plans.',
+    static_instruction=(
+        f"{_INDIAN_CONTEXT}"
+        "Role: personal travel assistant orchestrator.\n"
+        "1. Confirm once: home city/state, destination (if none, offer local and getaway options), dates/length, "
+        "travellers, preferences, INR budget.\n"
+        "2. Strictly in order, call `transfer_to_agent` to `intel_cluster` (weather + news in parallel), "
+        "`weather_intel_agent`, `local_news_safety_agent`, `safety_watch_agent`, then `trip_planner_agent`, "
+        "giving each the distilled context and continuing when control returns."
+    ),
     instruction=(
-        "You are the personal travel assistant orchestrator for Indian travellers.\n"
-        "Workflow:\n"
-        "1. Gather clarifying details (traveller home city and state, destination interest, travel dates/length, "
-        "travellers, preferences, budget in INR). Always confirm whether the user wants ideas in their current "
-        "location or is planning to travel elsewhere; if they do not specify a destination, offer both local "
-        "and getaway options starting from their Indian location. Ask follow-up questions once if critical "
-        "information is missing.\n"
-        "2. Delegate to `weather_data_agent` to obtain structured meteorological data.\n"
-        "3. Delegate to `weather_intel_agent` to translate that data into implications.\n"
-        "4. Delegate to `local_news_fetch_agent` to gather recent incident headlines.\n"
-        "5. Delegate to `local_news_safety_agent` for on-the-ground safety classification.\n"
-        "6. Delegate to `safety_watch_agent` for official advisories and policy guidance.\n"
-        "7. Delegate to `trip_planner_agent` to synthesize the itinerary.\n"
-        "8. Conclude with a polished response summarizing key insights and next actions, explicitly covering:\n"
-        "   • Approximate weather conditions for the travel window.\n"
-        "   • Safety level assessment (e.g., Safe/Caution/Avoid) with justification.\n"
-        "   • Packing guidance highlighting what to take.\n"
-        "   • Primary travel route from the stated origin to the destination.\n"
-        "   • Must-visit attractions or experiences.\n"
-        "   • Rough budget expectations in INR (add secondary currency only when relevant).\n"
-        "   • Legal or regulatory requirements (visas, permits, local laws) with emphasis on Indian documentation "
-        "needs for outbound trips.\n"
-        "Follow this sequence strictly: call `transfer_to_agent` to `weather_data_agent`, then "
-        "`weather_intel_agent`, `local_news_fetch_agent`, `local_news_safety_agent`, `safety_watch_agent`, "
-        "and finally `trip_planner_agent`. Provide each agent with the distilled context they need. After each "
-        "agent finishes and returns control, continue orchestrating the next step.\n"
-        "Ensure each sub-agent is invoked when their expertise is needed and that insights remain relatable "
-        "for Indian travellers (cuisine notes, cultural norms, payment modes, and logistics from India).\n"
-        "Do not produce the final plan until the trip planner agent has responded."
+        "`trip_planner_agent` streams the final plan; never write, repeat, or summarize it yourself.\n"
+        f"{_OFFLINE_MODE_NOTE}"
     ),
     sub_agents=[
-        weather_data_agent,
+        intel_cluster,
         weather_agent,
-        local_news_fetch_agent,
         local_news_agent,
         safety_agent,
         trip_planner_agent,
     ],
 )
+
+# Each agent's ``static_instruction`` (shared context, role, schema) is the
+# literal prefix of every request, so Gemini can serve it from an explicit
+# context cache; the short ``instruction`` footer is sent after it as content.
+app = App(
+    name='personal_assistant',
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        min_tokens=1024,
+        ttl_seconds=30 * 60,
+    ),
+)
@@ -0,0 +1,181 @@
+"""Offline (queued) execution of the ADK apps for non-interactive plans."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict
+from typing import Literal
+from typing import Optional
+from typing import Tuple
+from typing import TypedDict
+
+from cachetools import LRUCache
+from google.adk.apps.app import App
+from google.adk.events.event import Event
+from google.adk.sessions import DatabaseSessionService
+from google.genai import types
+
+from personal_assistant.agent import app as _DEFAULT_APP
+from personal_assistant.runners import get_runner
+
+_LOGGER = logging.getLogger(__name__)
+
+_DB_PATH = Path(__file__).resolve().parent / ".adk" / "offline_jobs.db"
+_DEFAULT_USER_ID = "offline"
+
+ExecutionMode = Literal["interactive", "offline"]
+
+# Jobs still running in this process; finished jobs are read back from SQLite
+# and only the errors of recent failures are kept in memory.
+_TASKS: Dict[str, Tuple[str, "asyncio.Task[None]"]] = {}
+_FAILURES: LRUCache = LRUCache(maxsize=256)
+_SESSION_SERVICE: Optional[DatabaseSessionService] = None
+
+
+class PlanJob(TypedDict, total=False):
+  job_id: str
+  app_name: str
+  status: str  # queued | running | done | failed
+  result: str
+  error: str
+
+
+def _session_service() -> DatabaseSessionService:
+  global _SESSION_SERVICE
+  if _SESSION_SERVICE is None:
+    _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _SESSION_SERVICE = DatabaseSessionService(
+        db_url=f"sqlite+aiosqlite:///{_DB_PATH}"
+    )
+  return _SESSION_SERVICE
+
+
+def _final_text(event: Event) -> Optional[str]:
+  if event.author == "user" or not event.is_final_response():
+    return None
+  if not event.content or not event.content.parts:
+    return None
+  text = "".join(part.text or "" for part in event.content.parts)
+  return text or None
+
+
+async def _run_job(app: App, user_id: str, job_id: str, message: str) -> None:
+  content = types.Content(role="user", parts=[types.Part(text=message)])
+  async for _ in get_runner(app, _session_service()).run_async(
+      user_id=user_id, session_id=job_id, new_message=content
+  ):
+    pass
+
+
+def _forget_task(job_id: str, task: "asyncio.Task[None]") -> None:
+  """Drop a finished job from ``_TASKS``, remembering why it failed."""
+  app_name, _ = _TASKS.pop(job_id)
+  error = "cancelled" if task.cancelled() else task.exception()
+  if error is not None:
+    _LOGGER.warning("Offline job %s failed: %s", job_id, error)
+    _FAILURES[(app_name, job_id)] = str(error)
+
+
+async def run_plan(
+    message: str,
+    *,
+    app: App = _DEFAULT_APP,
+    execution_mode: ExecutionMode = "interactive",
+    user_id: str = _DEFAULT_USER_ID,
+) -> PlanJob:
+  """Run a planning request, optionally in the background.
+
+  Args:
+    message: The full planning request; offline jobs cannot ask follow-ups,
+      so it should already contain origin, dates, budget, and preferences.
+    app: ADK app to run (travel planner by default, or the celebration app).
+    execution_mode: ``"interactive"`` waits for the plan; ``"offline"``
+      persists the job and returns its handle immediately.
+    user_id: Owner of the job's session.
+
+  Returns:
+    The job handle; ``result`` is set once the plan is done.
+  """
+  if not message or not message.strip():
+    raise ValueError("message is required")
+
+  session = await _session_service().create_session(
+      app_name=app.name,
+      user_id=user_id,
+      state={"execution_mode": execution_mode},
+  )
+  if execution_mode == "offline":
+    task = asyncio.create_task(_run_job(app, user_id, session.id, message))
+    task.add_done_callback(lambda done: _forget_task(session.id, done))
+    _TASKS[session.id] = (app.name, task)
+    return PlanJob(job_id=session.id, app_name=app.name, status="queued")
+
+  await _run_job(app, user_id, session.id, message)
+  return await get_plan(session.id, app=app, user_id=user_id)
+
+
+async def get_plan(
+    job_id: str, *, app: App, user_id: str = _DEFAULT_USER_ID
+) -> PlanJob:
+  """Return the current status of a job and, when done, its final plan.
+
+  Args:
+    job_id: ID from the handle returned by ``run_plan``.
+    app: The app the job was started with; sessions are stored per app.
+    user_id: Owner of the job's session.
+  """
+  job = PlanJob(job_id=job_id, app_name=app.name)
+  running = _TASKS.get(job_id)
+  if running is not None and running[0] == app.name:
+    job["status"] = "running"
+    return job
+  error = _FAILURES.get((app.name, job_id))
+  if error is not None:
+    job["status"] = "failed"
+    job["error"] = error
+    return job
+
+  session = await _session_service().get_session(
+      app_name=app.name, user_id=user_id, session_id=job_id
+  )
+  if session is None:
+    raise ValueError(f"Unknown job '{job_id}'.")
+
+  for event in reversed(session.events):
+    text = _final_text(event)
+    if text:
+      job["status"] = "done"
+      job["result"] = text
+      return job
+
+  # Either the run ended without a final answer or the process running it
+  # exited before it finished.
+  job["status"] = "failed"
+  job["error"] = "no final response recorded"
+  return job
+
+
+async def wait_for_plan(
+    job_id: str,
+    *,
+    app: App,
+    user_id: str = _DEFAULT_USER_ID,
+    poll_interval: float = 2.0,
+) -> PlanJob:
+  """Poll an offline job, started with ``app``, until it finishes."""
+  while True:
+    job = await get_plan(job_id, app=app, user_id=user_id)
+    if job["status"] not in ("queued", "running"):
+      return job
+    await asyncio.sleep(poll_interval)
+
+
+__all__ = [
+    "ExecutionMode",
+    "PlanJob",
+    "get_plan",
+    "run_plan",
+    "wait_for_plan",
+]
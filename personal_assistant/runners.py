@@ -0,0 +1,28 @@
+"""Runners shared by the offline and streaming entry points."""
+
+from __future__ import annotations
+
+from typing import Dict
+from typing import Tuple
+
+from google.adk.apps.app import App
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService
+
+# One runner per (app, session service) pair, created on first use.
+_RUNNERS: Dict[Tuple[str, int], Runner] = {}
+
+
+def get_runner(app: App, session_service: BaseSessionService) -> Runner:
+  """Return the runner for ``app`` backed by ``session_service``."""
+  key = (app.name, id(session_service))
+  runner = _RUNNERS.get(key)
+  if runner is None:
+    runner = Runner(app=app, session_service=session_service)
+    _RUNNERS[key] = runner
+  return runner
+
+
+__all__ = [
+    "get_runner",
+]
@@ -0,0 +1,140 @@
+"""Token streaming for the ADK apps with coalescing of small SSE frames."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import AsyncIterator
+from typing import Optional
+from typing import cast
+
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
+from google.adk.apps.app import App
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from personal_assistant.agent import app as _DEFAULT_APP
+from personal_assistant.runners import get_runner
+
+_DEFAULT_USER_ID = "streaming"
+# Marks the end of the upstream in the coalescing queue.
+_END = object()
+
+_SESSION_SERVICE = InMemorySessionService()
+
+
+async def coalesce(
+    chunks: AsyncIterator[str], max_delay_ms: float = 5
+) -> AsyncIterator[str]:
+  """Merge chunks, holding each one back for at most ``max_delay_ms``.
+
+  The first buffered chunk starts a deadline; everything that arrives before
+  it expires is flushed together, so a steady stream of deltas still yields
+  at least every ``max_delay_ms``.
+
+  The upstream is drained by a single producer task into a queue, so every
+  step of it runs in the same task and context (ADK keeps OpenTelemetry spans
+  open across its yields); timeouts only ever wait on the queue. Stopping
+  early cancels the producer, which closes the upstream.
+  """
+  max_delay = max_delay_ms / 1000
+  loop = asyncio.get_running_loop()
+  queue: "asyncio.Queue[object]" = asyncio.Queue()
+
+  async def _drain() -> None:
+    try:
+      async for chunk in chunks:
+        queue.put_nowait(chunk)
+    finally:
+      aclose = getattr(chunks, "aclose", None)
+      if aclose is not None:
+        await aclose()
+      queue.put_nowait(_END)
+
+  producer = asyncio.create_task(_drain())
+  buffer = []
+  deadline = 0.0
+  try:
+    while True:
+      try:
+        if buffer:
+          item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+        else:
+          item = await queue.get()
+          deadline = loop.time() + max_delay
+      except asyncio.TimeoutError:
+        yield "".join(buffer)
+        buffer.clear()
+        continue
+      if item is _END:
+        break
+      buffer.append(cast(str, item))
+    if buffer:
+      yield "".join(buffer)
+    # Re-raise anything the upstream failed with.
+    await producer
+  finally:
+    if not producer.done():
+      producer.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await producer
+
+
+async def _text_deltas(
+    app: App, user_id: str, session_id: str, message: str
+) -> AsyncIterator[str]:
+  content = types.Content(role="user", parts=[types.Part(text=message)])
+  async for event in get_runner(app, _SESSION_SERVICE).run_async(
+      user_id=user_id,
+      session_id=session_id,
+      new_message=content,
+      run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+  ):
+    # Partial events carry the incremental text; the closing aggregate event
+    # repeats it and is skipped.
+    if not event.partial or not event.content or not event.content.parts:
+      continue
+    text = "".join(part.text or "" for part in event.content.parts)
+    if text:
+      yield text
+
+
+async def stream_plan(
+    message: str,
+    *,
+    app: App = _DEFAULT_APP,
+    session_id: Optional[str] = None,
+    user_id: str = _DEFAULT_USER_ID,
+    max_delay_ms: float = 5,
+) -> AsyncIterator[str]:
+  """Stream the agents' text for one user turn.
+
+  Args:
+    message: The user's message.
+    app: ADK app to run (travel planner by default, or the celebration app).
+    session_id: Existing conversation to continue; a new one is created when
+      omitted.
+    user_id: Owner of the session.
+    max_delay_ms: Longest a text delta is held back to merge it with the
+      ones that follow.
+
+  Yields:
+    Coalesced text chunks in arrival order.
+  """
+  if session_id is None:
+    session = await _SESSION_SERVICE.create_session(
+        app_name=app.name, user_id=user_id
+    )
+    session_id = session.id
+
+  async for chunk in coalesce(
+      _text_deltas(app, user_id, session_id, message), max_delay_ms
+  ):
+    yield chunk
+
+
+__all__ = [
+    "coalesce",
+    "stream_plan",
+]
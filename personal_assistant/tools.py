@@ -2,31 +2,127 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import copy
 import datetime as _dt
+import io
 import logging
-import textwrap
+import re
+import threading
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import TypeVar
 from typing import TypedDict
 from typing import cast
 
-import requests
+from cachetools import Cache
+from cachetools import LRUCache
+from cachetools import TTLCache
+import httpx
+from lxml import etree
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 _GEOCODE_ENDPOINT = "https://geocoding-api.open-meteo.com/v1/search"
 _WEATHER_ENDPOINT = "https://api.open-meteo.com/v1/forecast"
 _NEWS_RSS_ENDPOINT = "https://news.google.com/rss/search"
 
+_USER_AGENT = "trip-assistant/1.0"
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 2
+_BACKOFF_FACTOR = 0.2
+
+# Pooled connections (and TLS sessions) are bound to the event loop that
+# opened them, so each running loop gets its own client, kept alive between
+# the geocode and forecast requests. ``retries`` only covers connection
+# failures; gateway errors are retried in ``_get``.
+_CLIENTS: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Geocoding is idempotent, so hits never expire; forecasts and headlines are
+# reused for 15 minutes. All caches share one lock.
+_CACHE_LOCK = threading.Lock()
+_GEOCODE_CACHE: LRUCache = LRUCache(maxsize=1024)
+_WEATHER_CACHE: TTLCache = TTLCache(maxsize=512, ttl=900)
+_SAFETY_CACHE: TTLCache = TTLCache(maxsize=512, ttl=900)
+# Validators plus the parsed, trimmed body per request, outliving the TTL
+# caches so an expired entry can be revalidated with a conditional GET instead
+# of re-downloaded. Raw bodies are never kept.
+_VALIDATOR_CACHE: LRUCache = LRUCache(maxsize=1024)
+
+# Popular destinations whose forecast can be requested before the geocoder
+# answers. A guess is kept only if it lands within the tolerance (degrees).
+_SPECULATIVE_COORDINATES: Dict[str, Tuple[float, float]] = {
+    "bangkok": (13.75, 100.52),
+    "bali": (-8.41, 115.19),
+    "colombo": (6.93, 79.85),
+    "delhi": (28.65, 77.23),
+    "dubai": (25.08, 55.31),
+    "goa": (15.49, 73.83),
+    "kathmandu": (27.70, 85.32),
+    "london": (51.51, -0.13),
+    "mumbai": (19.07, 72.88),
+    "paris": (48.85, 2.35),
+    "singapore": (1.29, 103.85),
+}
+_COORDINATE_TOLERANCE = 0.25
+
+# Tool arguments come from the LLM; out-of-range values are clamped and
+# oversized locations rejected before any request is made.
+_MAX_LOCATION_LENGTH = 200
+_MIN_DAYS = 1
+_MAX_DAYS = 7
+_MAX_HEADLINES = 20
+_MAX_DESTINATIONS = 10
+
+_WS_RE = re.compile(r"\s+")
+_SNIPPET_WIDTH = 240
+_HOURLY_TIME_FORMAT = "%Y-%m-%dT%H:%M"
+_FORECAST_KEYS = ("current_weather", "daily", "hourly", "utc_offset_seconds")
+
+# Forecast columns (summary name -> Open-Meteo variable), returned as parallel
+# lists exactly as Open-Meteo sends them.
+_DAILY_COLUMNS: Dict[str, str] = {
+    "dates": "time",
+    "max_temp_c": "temperature_2m_max",
+    "min_temp_c": "temperature_2m_min",
+    "precip_probability": "precipitation_probability_max",
+    "precipitation_total_mm": "precipitation_sum",
+    "uv_index_max": "uv_index_max",
+    "wind_speed_max_kmh": "wind_speed_10m_max",
+    "sunrise": "sunrise",
+    "sunset": "sunset",
+}
+_HOURLY_COLUMNS: Dict[str, str] = {
+    "times": "time",
+    "temperature_c": "temperature_2m",
+    "precip_probability": "precipitation_probability",
+    "relative_humidity": "relativehumidity_2m",
+    "weather_code": "weathercode",
+}
+
+# Compiled once; ``string()`` yields "" for missing children.
+_TITLE_XPATH = etree.XPath("string(title)")
+_LINK_XPATH = etree.XPath("string(link)")
+_PUB_DATE_XPATH = etree.XPath("string(pubDate)")
+_DESCRIPTION_XPATH = etree.XPath("string(description)")
+
 
 class WeatherSummary(TypedDict, total=False):
   location: str
   latitude: float
   longitude: float
   current_conditions: Dict[str, Any]
-  daily_forecast: List[Dict[str, Any]]
+  daily_forecast: Dict[str, List[Any]]
+  hourly_outlook: Dict[str, List[Any]]
   source: str
 
 
@@ -43,9 +139,132 @@ class SafetyBrief(TypedDict, total=False):
   source: str
 
 
-def _resolve_location(location: str) -> Tuple[float, float, str]:
+def _validate_location(location: str) -> None:
+  if not location or not location.strip():
+    raise ValueError("location is required")
+  if len(location) > _MAX_LOCATION_LENGTH:
+    raise ValueError(
+        f"location must be at most {_MAX_LOCATION_LENGTH} characters"
+    )
+
+
+def _client() -> httpx.AsyncClient:
+  """Return the shared client for the running event loop, creating it lazily."""
+  loop = asyncio.get_running_loop()
+  with _CLIENTS_LOCK:
+    client = _CLIENTS.get(loop)
+    if client is None:
+      # A closed loop's connections can no longer be used or closed; drop them.
+      for stale in [other for other in _CLIENTS if other.is_closed()]:
+        del _CLIENTS[stale]
+      client = httpx.AsyncClient(
+          timeout=10,
+          headers={"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"},
+          transport=httpx.AsyncHTTPTransport(
+              http2=True,
+              retries=_MAX_RETRIES,
+              limits=httpx.Limits(
+                  max_keepalive_connections=16, max_connections=32
+              ),
+          ),
+      )
+      _CLIENTS[loop] = client
+  return client
+
+
+def _cache_get(cache: Cache, key: Any, label: str) -> Any:
+  """Return a copy of the value cached for ``key`` or ``None``, logging hits.
+
+  Values are copied on the way in and out so callers can mutate what they get
+  without corrupting the cache.
+  """
+  with _CACHE_LOCK:
+    value = cache.get(key)
+  _LOGGER.debug("%s cache %s for %r", label, "hit" if value else "miss", key)
+  return copy.deepcopy(value)
+
+
+def _cache_put(cache: Cache, key: Any, value: Any) -> None:
+  value = copy.deepcopy(value)
+  with _CACHE_LOCK:
+    cache[key] = value
+
+
+async def _get(
+    url: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+) -> httpx.Response:
+  """GET ``url`` on the loop's client, retrying transient gateway errors."""
+  for attempt in range(_MAX_RETRIES + 1):
+    response = await _client().get(url, params=params, headers=headers)
+    if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+      break
+    await asyncio.sleep(_BACKOFF_FACTOR * (2**attempt))
+  if response.status_code != 304:
+    response.raise_for_status()
+  return response
+
+
+def _request_key(url: str, params: Dict[str, Any]) -> Tuple[Any, ...]:
+  return (url,) + tuple(
+      sorted(
+          (name, tuple(value) if isinstance(value, list) else value)
+          for name, value in params.items()
+      )
+  )
+
+
+async def _get_conditional(
+    url: str, params: Dict[str, Any], parse: Callable[[bytes], _T]
+) -> _T:
+  """GET and parse ``url``, revalidating a previous response when possible.
+
+  Responses carrying an ``ETag`` or ``Last-Modified`` header are remembered
+  together with ``parse``'s result, which should keep only what callers use;
+  the next request for the same URL and params sends them back and, on
+  ``304 Not Modified``, reuses that result.
+  """
+  key = _request_key(url, params)
+  entry = _cache_get(_VALIDATOR_CACHE, key, "validator")
+
+  headers: Dict[str, str] = {}
+  if entry:
+    etag, last_modified, _ = entry
+    if etag:
+      headers["If-None-Match"] = etag
+    if last_modified:
+      headers["If-Modified-Since"] = last_modified
+
+  response = await _get(url, params=params, headers=headers)
+  if response.status_code == 304 and entry:
+    _LOGGER.debug("%s not modified; reusing cached body", url)
+    return entry[2]
+  if response.status_code == 304:
+    # Never sent validators, so a bare 304 is a server error.
+    response.raise_for_status()
+
+  payload = parse(response.content)
+  etag = response.headers.get("ETag")
+  last_modified = response.headers.get("Last-Modified")
+  if etag or last_modified:
+    _cache_put(_VALIDATOR_CACHE, key, (etag, last_modified, payload))
+  return payload
+
+
+def _parse_geocode(content: bytes) -> Dict[str, Any]:
+  """Keep only the top geocoder hit."""
+  return {"results": (orjson.loads(content).get("results") or [])[:1]}
+
+
+async def _resolve_location(location: str) -> Tuple[float, float, str]:
   """Resolve a free-form location string into coordinates."""
-  response = requests.get(
+  cache_key = location.lower().strip()
+  cached = _cache_get(_GEOCODE_CACHE, cache_key, "geocode")
+  if cached:
+    return cached
+
+  payload = await _get_conditional(
       _GEOCODE_ENDPOINT,
       params={
           "name": location,
@@ -53,11 +272,9 @@ def _resolve_location(location: str) -> Tuple[float, float, str]:
           "language": "en",
           "format": "json",
       },
-      timeout=10,
+      parse=_parse_geocode,
   )
-  response.raise_for_status()
-  payload = response.json()
-  results = payload.get("results") or []
+  results = payload["results"]
   if not results:
     raise ValueError(f"Unable to geocode location '{location}'.")
 
@@ -73,83 +290,128 @@ def _resolve_location(location: str) -> Tuple[float, float, str]:
   )
   lat = cast(float, top_hit["latitude"])
   lon = cast(float, top_hit["longitude"])
+  _cache_put(_GEOCODE_CACHE, cache_key, (lat, lon, resolved_name))
   return lat, lon, resolved_name
 
 
-def fetch_weather_summary(
-    location: str, *, days: int = 5, include_hourly: bool = False
-) -> WeatherSummary:
-  """Fetch a short-term weather outlook for a destination.
+def _column(block: Dict[str, Any], key: str, length: int) -> List[Any]:
+  """Return ``block[key]`` trimmed or padded with ``None`` to ``length``."""
+  values = (block.get(key) or [])[:length]
+  return values + [None] * (length - len(values))
 
-  Args:
-    location: Free-form location to resolve (city, landmark, etc.).
-    days: Number of daily entries to include (1-7 supported by Open-Meteo).
-    include_hourly: Whether to include hourly data for the next 24 hours.
 
-  Returns:
-    Structured weather summary suitable for LLM consumption.
-  """
-  if not location or not location.strip():
-    raise ValueError("location is required")
+def _speculative_coordinates(location: str) -> Optional[Tuple[float, float]]:
+  """Guess coordinates for a location without calling the geocoder."""
+  return _SPECULATIVE_COORDINATES.get(location.lower().strip())
+
+
+def _coordinates_match(
+    first: Tuple[float, float], second: Tuple[float, float]
+) -> bool:
+  return (
+      abs(first[0] - second[0]) <= _COORDINATE_TOLERANCE
+      and abs(first[1] - second[1]) <= _COORDINATE_TOLERANCE
+  )
 
-  lat, lon, resolved_name = _resolve_location(location)
 
+def _parse_forecast(content: bytes) -> Dict[str, Any]:
+  """Keep only the forecast blocks the weather summary reads."""
+  payload = orjson.loads(content)
+  return {key: payload[key] for key in _FORECAST_KEYS if key in payload}
+
+
+async def _fetch_forecast(
+    lat: float, lon: float, *, include_hourly: bool
+) -> Dict[str, Any]:
+  """Request current, daily and (optionally) hourly data in one call."""
   params = {
       "latitude": lat,
       "longitude": lon,
       "timezone": "auto",
       "current_weather": True,
       "daily": [
-          "temperature_2m_max",
-          "temperature_2m_min",
-          "precipitation_probability_max",
-          "sunrise",
-          "sunset",
-          "uv_index_max",
-          "wind_speed_10m_max",
-          "precipitation_sum",
+          source for source in _DAILY_COLUMNS.values() if source != "time"
       ],
   }
 
   if include_hourly:
     params["hourly"] = [
-        "temperature_2m",
-        "precipitation_probability",
-        "weathercode",
-        "relativehumidity_2m",
+        source for source in _HOURLY_COLUMNS.values() if source != "time"
     ]
 
-  response = requests.get(_WEATHER_ENDPOINT, params=params, timeout=10)
-  response.raise_for_status()
-  payload = response.json()
+  return await _get_conditional(_WEATHER_ENDPOINT, params, _parse_forecast)
+
+
+async def _weather_and_geo(
+    location: str, *, include_hourly: bool
+) -> Tuple[float, float, str, Dict[str, Any]]:
+  """Resolve a location and fetch its forecast with as few round-trips as possible.
+
+  Cached geocodes go straight to the forecast. On a cache miss for a
+  well-known destination the forecast is fetched speculatively alongside the
+  geocode and only re-issued if the geocoder disagrees with the guess; when it
+  agrees, the guess is kept as the location's coordinates.
+  """
+  with _CACHE_LOCK:
+    geocoded = location.lower().strip() in _GEOCODE_CACHE
+  guess = None if geocoded else _speculative_coordinates(location)
+  if guess is None:
+    lat, lon, resolved_name = await _resolve_location(location)
+    payload = await _fetch_forecast(lat, lon, include_hourly=include_hourly)
+    return lat, lon, resolved_name, payload
+
+  (lat, lon, resolved_name), payload = await asyncio.gather(
+      _resolve_location(location),
+      _fetch_forecast(*guess, include_hourly=include_hourly),
+  )
+  if not _coordinates_match((lat, lon), guess):
+    _LOGGER.debug("Speculative coordinates for %r missed; refetching", location)
+    payload = await _fetch_forecast(lat, lon, include_hourly=include_hourly)
+    return lat, lon, resolved_name, payload
+
+  # The forecast was fetched for the guess, so report it and cache it as the
+  # location's coordinates; later calls then hit the same forecast URL and can
+  # revalidate it.
+  lat, lon = guess
+  _cache_put(
+      _GEOCODE_CACHE, location.lower().strip(), (lat, lon, resolved_name)
+  )
+  return lat, lon, resolved_name, payload
+
+
+async def fetch_weather_summary(
+    location: str, *, days: int = 5, include_hourly: bool = False
+) -> WeatherSummary:
+  """Fetch a short-term weather outlook for a destination.
+
+  Args:
+    location: Free-form location to resolve (city, landmark, etc.).
+    days: Number of daily entries to include, clamped to 1-7.
+    include_hourly: Whether to include hourly data for the next 24 hours.
+
+  Returns:
+    Structured weather summary suitable for LLM consumption. The daily
+    forecast and hourly outlook are column lists aligned by index.
+  """
+  _validate_location(location)
+  days = max(_MIN_DAYS, min(_MAX_DAYS, int(days)))
+
+  cache_key = (location.lower().strip(), days, include_hourly)
+  cached = _cache_get(_WEATHER_CACHE, cache_key, "weather")
+  if cached:
+    return cached
+
+  lat, lon, resolved_name, payload = await _weather_and_geo(
+      location, include_hourly=include_hourly
+  )
 
   current = payload.get("current_weather", {}) or {}
   daily = payload.get("daily", {}) or {}
-  days_available = min(days, len(daily.get("time", [])))
-
-  daily_forecast: List[Dict[str, Any]] = []
-  for idx in range(days_available):
-    daily_forecast.append(
-        {
-            "date": daily.get("time", [])[idx],
-            "summary": {
-                "max_temp_c": daily.get("temperature_2m_max", [None])[idx],
-                "min_temp_c": daily.get("temperature_2m_min", [None])[idx],
-                "precip_probability": daily.get(
-                    "precipitation_probability_max", [None]
-                )[idx],
-                "precipitation_total_mm": daily.get(
-                    "precipitation_sum", [None]
-                )[idx],
-                "uv_index_max": daily.get("uv_index_max", [None])[idx],
-                "wind_speed_max_kmh": daily.get(
-                    "wind_speed_10m_max", [None]
-                )[idx],
-            },
-            "sunrise": daily.get("sunrise", [None])[idx],
-            "sunset": daily.get("sunset", [None])[idx],
-        }
-    )
+  days_available = min(days, len(daily.get("time") or []))
+  daily_forecast = {
+      name: _column(daily, source, days_available)
+      for name, source in _DAILY_COLUMNS.items()
+  }
 
   summary: WeatherSummary = {
       "location": resolved_name,
@@ -167,52 +429,88 @@ def fetch_weather_summary(
 
   if include_hourly and "hourly" in payload:
     hourly_data = payload["hourly"]
-    next_24_hours: List[Dict[str, Any]] = []
-    base_times = hourly_data.get("time", [])
-    now = _dt.datetime.now(_dt.timezone.utc)
-    for idx, time_str in enumerate(base_times):
-      timestamp = _dt.datetime.fromisoformat(time_str)
-      if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=_dt.timezone.utc)
-      else:
-        timestamp = timestamp.astimezone(_dt.timezone.utc)
-      if timestamp < now:
-        continue
-      if timestamp > now + _dt.timedelta(hours=24):
-        break
-      next_24_hours.append(
-          {
-              "time": time_str,
-              "temperature_c": hourly_data.get("temperature_2m", [None])[idx],
-              "precip_probability": hourly_data.get(
-                  "precipitation_probability", [None]
-              )[idx],
-              "relative_humidity": hourly_data.get(
-                  "relativehumidity_2m", [None]
-              )[idx],
-              "weather_code": hourly_data.get("weathercode", [None])[idx],
-          }
-      )
-    summary["hourly_outlook"] = next_24_hours  # type: ignore[typeddict-item]
+    base_times = hourly_data.get("time") or []
+    # Open-Meteo returns ascending, naive local "YYYY-MM-DDTHH:MM" strings, so
+    # the next-24h window is found by bisecting on same-format bounds.
+    offset = _dt.timedelta(seconds=payload.get("utc_offset_seconds") or 0)
+    now = _dt.datetime.now(_dt.timezone.utc).replace(tzinfo=None) + offset
+    upper = now + _dt.timedelta(hours=24)
+    start = bisect.bisect_left(base_times, now.strftime(_HOURLY_TIME_FORMAT))
+    stop = bisect.bisect_right(
+        base_times, upper.strftime(_HOURLY_TIME_FORMAT), lo=start
+    )
+    summary["hourly_outlook"] = {
+        name: _column(hourly_data, source, stop)[start:]
+        for name, source in _HOURLY_COLUMNS.items()
+    }
 
+  _cache_put(_WEATHER_CACHE, cache_key, summary)
   return summary
 
 
-def fetch_safety_brief(
+def _shorten(text: str) -> str:
+  """Collapse whitespace and cut ``text`` to the snippet width."""
+  text = _WS_RE.sub(" ", text).strip()
+  if len(text) <= _SNIPPET_WIDTH:
+    return text
+  return text[: _SNIPPET_WIDTH - 1].rstrip() + "…"
+
+
+def _parse_headlines(content: bytes) -> List[SafetyHeadline]:
+  """Extract up to ``_MAX_HEADLINES`` headlines from a Google News RSS body."""
+  headlines: List[SafetyHeadline] = []
+  # Stream the raw bytes and stop once enough entries were seen instead of
+  # building a tree for the whole feed. The feed is untrusted, so external
+  # entities are not resolved and nothing is fetched over the network;
+  # internal entities still expand, with libxml2 capping their amplification.
+  items = etree.iterparse(
+      io.BytesIO(content),
+      events=("end",),
+      tag="item",
+      resolve_entities=False,
+      no_network=True,
+  )
+  for seen, (_, item) in enumerate(items, start=1):
+    title = _TITLE_XPATH(item).strip()
+    link = _LINK_XPATH(item).strip()
+    pub_date = _PUB_DATE_XPATH(item).strip()
+    description = _DESCRIPTION_XPATH(item).strip()
+    snippet = _shorten(description.replace("<br>", " "))
+    item.clear()
+    if title and link:
+      headlines.append(
+          SafetyHeadline(
+              title=title,
+              link=link,
+              published=pub_date,
+              snippet=snippet,
+          )
+      )
+    if seen >= _MAX_HEADLINES:
+      break
+  return headlines
+
+
+async def fetch_safety_brief(
     location: str, *, max_items: int = 4, language: str = "en-US"
 ) -> SafetyBrief:
   """Fetch recent safety-related headlines for a destination.
 
   Args:
     location: Free-form location string to search against.
-    max_items: Maximum number of entries to return.
+    max_items: Maximum number of entries to return, clamped to 1-20.
     language: Google News language/locale code.
 
   Returns:
     A structured brief with URLs that downstream agents can summarize.
   """
-  if not location or not location.strip():
-    raise ValueError("location is required")
+  _validate_location(location)
+  max_items = max(1, min(_MAX_HEADLINES, int(max_items)))
+
+  cache_key = (location.lower().strip(), max_items, language)
+  cached = _cache_get(_SAFETY_CACHE, cache_key, "safety")
+  if cached:
+    return cached
 
   query = f"{location} travel warning OR safety advisory OR disruption OR protest"
   params = {
@@ -222,55 +520,82 @@ def fetch_safety_brief(
       "ceid": language.replace("-", ":"),
   }
 
-  response = requests.get(
-      _NEWS_RSS_ENDPOINT, params=params, timeout=10, headers={"User-Agent": "trip-assistant/1.0"}
-  )
-  response.raise_for_status()
-  response.encoding = response.apparent_encoding
-
-  headlines: List[SafetyHeadline] = []
-
   try:
-    import xml.etree.ElementTree as ET
-
-    tree = ET.fromstring(response.text)
-    for item in tree.findall(".//item")[:max_items]:
-      title = (item.findtext("title") or "").strip()
-      link = (item.findtext("link") or "").strip()
-      pub_date = (item.findtext("pubDate") or "").strip()
-      description = (item.findtext("description") or "").strip()
-      snippet = textwrap.shorten(
-          description.replace("<br>", " ").replace("\n", " "), width=240
-      )
-      if not title or not link:
-        continue
-      headlines.append(
-          SafetyHeadline(
-              title=title,
-              link=link,
-              published=pub_date,
-              snippet=snippet,
-          )
-      )
-  except Exception as exc:  # pylint: disable=broad-except
+    headlines = await _get_conditional(
+        _NEWS_RSS_ENDPOINT, params, _parse_headlines
+    )
+  except etree.LxmlError as exc:
     _LOGGER.warning("Failed to parse safety brief for %s: %s", location, exc)
     raise
+  headlines = headlines[:max_items]
 
   if not headlines:
     raise ValueError(
         f"Unable to find recent safety headlines for '{location}'."
     )
 
-  return SafetyBrief(
+  brief = SafetyBrief(
       location=location,
       headlines=headlines,
       source="Google News RSS",
   )
+  _cache_put(_SAFETY_CACHE, cache_key, brief)
+  return brief
+
+
+async def fetch_safety_briefs(
+    locations: List[str], *, max_items: int = 4, language: str = "en-US"
+) -> List[SafetyBrief]:
+  """Fetch safety briefs for several destinations concurrently.
+
+  Args:
+    locations: Destinations of a multi-city itinerary, in travel order.
+    max_items: Maximum number of entries to return per destination.
+    language: Google News language/locale code.
+
+  Returns:
+    One brief per destination that had recent headlines, in input order.
+  """
+  unique: Dict[str, str] = {}
+  for location in locations:
+    _validate_location(location)
+    unique.setdefault(location.lower().strip(), location)
+  if not unique:
+    raise ValueError("at least one location is required")
+  if len(unique) > _MAX_DESTINATIONS:
+    raise ValueError(f"at most {_MAX_DESTINATIONS} locations are supported")
+
+  results = await asyncio.gather(
+      *(
+          fetch_safety_brief(location, max_items=max_items, language=language)
+          for location in unique.values()
+      ),
+      return_exceptions=True,
+  )
+
+  briefs: List[SafetyBrief] = []
+  for location, result in zip(unique.values(), results):
+    if isinstance(result, Exception):
+      _LOGGER.warning("Skipping safety brief for %s: %s", location, result)
+      continue
+    if isinstance(result, BaseException):
+      # Cancellation (and other non-``Exception`` errors) is not a lookup
+      # failure to skip; propagate it.
+      raise result
+    briefs.append(result)
+
+  if not briefs:
+    raise ValueError(
+        "Unable to find recent safety headlines for any of "
+        f"{', '.join(repr(location) for location in unique.values())}."
+    )
+  return briefs
 
 
 __all__ = [
     "fetch_weather_summary",
     "fetch_safety_brief",
+    "fetch_safety_briefs",
     "WeatherSummary",
     "SafetyBrief",
 ]